@@ -6,14 +6,57 @@ Generates realistic synthetic data for workspace analytics
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _occupancy_kernel(days, base_occupancy, dow, seed):
+        """Per-day occupancy loop compiled to native code.
+
+        Kept as an alternative to the vectorized path for when the
+        per-day logic grows stateful (e.g. occupancy depending on the
+        previous day) and no longer maps onto whole-array operations.
+        """
+        np.random.seed(seed)
+        out = np.empty(days)
+        for day in range(days):
+            if dow[day] >= 5:
+                occupancy = base_occupancy * np.random.uniform(0.3, 0.5)
+            else:
+                occupancy = base_occupancy + np.random.uniform(-10.0, 15.0)
+            occupancy += (day / days) * 5
+            out[day] = min(occupancy, 100.0)
+        return out
+
+def _run_generator(method_name, seed, kwargs):
+    """Worker entry point: build a freshly seeded generator and run one
+    generate_* method in a child process"""
+    generator = WeWorkDataGenerator(seed=seed)
+    return getattr(generator, method_name)(**kwargs)
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV via PyArrow's C++ writer when available"""
+    if pa is not None:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+    else:
+        df.to_csv(path, index=False)
 
 class WeWorkDataGenerator:
-    def __init__(self):
+    def __init__(self, seed=42):
+        # Single Generator for every draw; seeded for reproducibility
+        self.rng = np.random.default_rng(seed)
+
         self.locations = [
             'Bangalore - MG Road',
             'Mumbai - BKC', 
@@ -26,75 +69,92 @@ class WeWorkDataGenerator:
         
         self.member_types = ['Startup', 'Freelancer', 'Enterprise', 'SME']
         
-    def generate_occupancy_data(self, days=90):
+    def generate_occupancy_data(self, days=90, use_numba=False):
         """Generate daily occupancy data for multiple locations"""
-        data = []
-        start_date = datetime.now() - timedelta(days=days)
-        
-        for location in self.locations:
-            base_occupancy = random.uniform(70, 85)
-            
-            for day in range(days):
-                current_date = start_date + timedelta(days=day)
-                day_of_week = current_date.weekday()
-                
-                # Weekend effect
-                if day_of_week >= 5:
-                    occupancy = base_occupancy * random.uniform(0.3, 0.5)
-                else:
-                    occupancy = base_occupancy + random.uniform(-10, 15)
-                
-                # Add trend
-                trend = (day / days) * 5
-                occupancy += trend
-                
-                capacity = 100
-                actual_occupancy = min(occupancy, capacity)
-                
-                data.append({
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'location': location,
-                    'occupancy_rate': round(actual_occupancy, 2),
-                    'capacity': capacity,
-                    'occupied_desks': int(actual_occupancy),
-                    'day_of_week': current_date.strftime('%A')
-                })
-        
-        return pd.DataFrame(data)
+        dates = pd.date_range(end=datetime.now(), periods=days)
+        dow = dates.weekday.values
+        trend = (np.arange(days) / days) * 5
+        capacity = 100
+
+        occupancy_parts = []
+        for i, location in enumerate(self.locations):
+            base_occupancy = self.rng.uniform(70, 85)
+
+            if use_numba and numba is not None:
+                # JIT-compiled per-day loop; same shape of logic,
+                # native speed
+                occupancy_parts.append(
+                    _occupancy_kernel(days, base_occupancy, dow, i))
+                continue
+
+            # Weekend effect, drawn for every day in one shot
+            weekend_mult = self.rng.uniform(0.3, 0.5, size=days)
+            weekday_noise = self.rng.uniform(-10, 15, size=days)
+            occupancy = np.where(dow >= 5,
+                                 base_occupancy * weekend_mult,
+                                 base_occupancy + weekday_noise)
+
+            # Add trend
+            occupancy = occupancy + trend
+            occupancy_parts.append(np.minimum(occupancy, capacity))
+
+        actual_occupancy = np.concatenate(occupancy_parts)
+        date_str = dates.strftime('%Y-%m-%d')
+        dow_str = dates.strftime('%A')
+
+        location_codes = np.repeat(np.arange(len(self.locations)), days)
+
+        return pd.DataFrame({
+            'date': np.tile(date_str, len(self.locations)),
+            'location': pd.Categorical.from_codes(location_codes,
+                                                  categories=self.locations),
+            'occupancy_rate': np.round(actual_occupancy, 2).astype(np.float32),
+            'capacity': capacity,
+            'occupied_desks': actual_occupancy.astype(np.int32),
+            'day_of_week': pd.Categorical(np.tile(dow_str, len(self.locations)))
+        })
     
     def generate_hourly_data(self, days=7):
         """Generate hourly utilization data"""
-        data = []
-        start_date = datetime.now() - timedelta(days=days)
-        
-        for location in self.locations:
-            for day in range(days):
-                current_date = start_date + timedelta(days=day)
-                
-                for hour in range(9, 20):  # 9 AM to 8 PM
-                    # Peak hours: 11 AM - 3 PM
-                    if 11 <= hour <= 15:
-                        utilization = random.uniform(80, 95)
-                    elif hour in [9, 10, 16, 17]:
-                        utilization = random.uniform(60, 80)
-                    else:
-                        utilization = random.uniform(40, 60)
-                    
-                    data.append({
-                        'datetime': f"{current_date.strftime('%Y-%m-%d')} {hour:02d}:00",
-                        'location': location,
-                        'hour': hour,
-                        'utilization_rate': round(utilization, 2),
-                        'bookings': int(utilization * 0.8),
-                        'walk_ins': int(utilization * 0.2)
-                    })
-        
-        return pd.DataFrame(data)
+        dates = pd.date_range(end=datetime.now(), periods=days)
+        hours = np.arange(9, 20)  # 9 AM to 8 PM
+
+        # Peak hours: 11 AM - 3 PM
+        peak = (hours >= 11) & (hours <= 15)
+        shoulder = np.isin(hours, [9, 10, 16, 17])
+
+        # One uniform draw for every (location, day, hour) cell, rescaled
+        # into the right band per hour tier
+        shape = (len(self.locations), days, len(hours))
+        u = self.rng.uniform(0, 1, size=shape)
+        utilization = np.select(
+            [peak, shoulder],
+            [80 + u * 15, 60 + u * 20],
+            default=40 + u * 20
+        ).ravel()
+
+        # Format dates once per day and hours once per hour, then glue the
+        # pieces together instead of strftime-ing every timestamp
+        date_str = np.repeat(dates.strftime('%Y-%m-%d '), len(hours))
+        hour_str = np.tile(np.array(['{:02d}:00'.format(h) for h in hours]),
+                           days)
+        timestamps = np.char.add(date_str, hour_str)
+
+        location_codes = np.repeat(np.arange(len(self.locations)),
+                                   days * len(hours))
+
+        return pd.DataFrame({
+            'datetime': np.tile(timestamps, len(self.locations)),
+            'location': pd.Categorical.from_codes(location_codes,
+                                                  categories=self.locations),
+            'hour': np.tile(hours, len(self.locations) * days),
+            'utilization_rate': np.round(utilization, 2).astype(np.float32),
+            'bookings': (utilization * 0.8).astype(np.int32),
+            'walk_ins': (utilization * 0.2).astype(np.int32)
+        })
     
     def generate_revenue_data(self, months=3):
         """Generate revenue data by space type"""
-        data = []
-        
         pricing = {
             'Hot Desk': 5000,
             'Dedicated Desk': 8000,
@@ -102,69 +162,92 @@ class WeWorkDataGenerator:
             'Meeting Room': 500  # per hour
         }
         
-        for location in self.locations:
-            for space_type in self.space_types:
-                base_units = random.randint(20, 100)
-                
-                for month in range(months):
-                    units_sold = int(base_units * random.uniform(0.8, 1.2))
-                    revenue = units_sold * pricing[space_type]
-                    
-                    data.append({
-                        'month': month + 1,
-                        'location': location,
-                        'space_type': space_type,
-                        'units_sold': units_sold,
-                        'revenue': revenue,
-                        'avg_price': pricing[space_type]
-                    })
-        
-        return pd.DataFrame(data)
+        L, S, M = len(self.locations), len(self.space_types), months
+        price = np.array([pricing[s] for s in self.space_types])
+
+        # One base-units draw per (location, space_type), broadcast across
+        # months with per-month multipliers
+        base_units = self.rng.integers(20, 101, size=(L, S))
+        mult = self.rng.uniform(0.8, 1.2, size=(L, S, M))
+        units_sold = (base_units[..., None] * mult).astype(np.int32)
+        revenue = units_sold * price[None, :, None]
+
+        location_codes = np.repeat(np.arange(L), S * M)
+        space_codes = np.tile(np.repeat(np.arange(S), M), L)
+
+        return pd.DataFrame({
+            'month': np.tile(np.arange(1, M + 1), L * S),
+            'location': pd.Categorical.from_codes(location_codes,
+                                                  categories=self.locations),
+            'space_type': pd.Categorical.from_codes(space_codes,
+                                                    categories=self.space_types),
+            'units_sold': units_sold.ravel(),
+            'revenue': revenue.ravel(),
+            'avg_price': np.tile(np.repeat(price, M), L)
+        })
     
     def generate_member_data(self, count=500):
         """Generate member demographics data"""
-        data = []
-        
-        for i in range(count):
-            join_date = datetime.now() - timedelta(days=random.randint(1, 365))
-            
-            member_type = random.choice(self.member_types)
-            location = random.choice(self.locations)
-            space_type = random.choice(self.space_types)
-            
-            # Tenure affects churn probability
-            tenure_days = (datetime.now() - join_date).days
-            churn_prob = max(0.1, 0.4 - (tenure_days / 365) * 0.2)
-            is_active = random.random() > churn_prob
-            
-            data.append({
-                'member_id': f'MEM{i+1:04d}',
-                'member_type': member_type,
-                'location': location,
-                'space_type': space_type,
-                'join_date': join_date.strftime('%Y-%m-%d'),
-                'tenure_days': tenure_days,
-                'is_active': is_active,
-                'monthly_value': random.randint(5000, 20000)
-            })
-        
-        return pd.DataFrame(data)
+        now = datetime.now()
+        tenure_days = self.rng.integers(1, 366, size=count, dtype=np.int32)
+        join_dates = pd.DatetimeIndex(
+            now - pd.to_timedelta(tenure_days, unit='D'))
+
+        # Tenure affects churn probability
+        churn_prob = np.maximum(0.1, 0.4 - (tenure_days / 365) * 0.2)
+        is_active = self.rng.random(count) > churn_prob
+
+        member_ids = np.char.add(
+            'MEM', np.char.zfill(np.arange(1, count + 1).astype(str), 4))
+
+        return pd.DataFrame({
+            'member_id': member_ids,
+            'member_type': pd.Categorical.from_codes(
+                self.rng.integers(0, len(self.member_types), size=count),
+                categories=self.member_types),
+            'location': pd.Categorical.from_codes(
+                self.rng.integers(0, len(self.locations), size=count),
+                categories=self.locations),
+            'space_type': pd.Categorical.from_codes(
+                self.rng.integers(0, len(self.space_types), size=count),
+                categories=self.space_types),
+            'join_date': join_dates.strftime('%Y-%m-%d'),
+            'tenure_days': tenure_days,
+            'is_active': is_active,
+            'monthly_value': self.rng.integers(5000, 20001, size=count)
+        })
     
     def generate_all_data(self):
         """Generate all datasets and save to CSV"""
         print("🚀 Generating WeWork Analytics Data...")
         
-        # Generate datasets
-        occupancy_df = self.generate_occupancy_data(days=90)
-        hourly_df = self.generate_hourly_data(days=7)
-        revenue_df = self.generate_revenue_data(months=3)
-        member_df = self.generate_member_data(count=500)
+        # Generate the four independent datasets in parallel worker
+        # processes, each with its own deterministic child seed
+        jobs = [
+            ('generate_occupancy_data', {'days': 90}),
+            ('generate_hourly_data', {'days': 7}),
+            ('generate_revenue_data', {'months': 3}),
+            ('generate_member_data', {'count': 500})
+        ]
+        seeds = np.random.SeedSequence(42).spawn(len(jobs))
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_run_generator, name, seed, kwargs)
+                       for (name, kwargs), seed in zip(jobs, seeds)]
+            occupancy_df, hourly_df, revenue_df, member_df = [
+                future.result() for future in futures]
         
-        # Save to CSV
-        occupancy_df.to_csv('occupancy_data.csv', index=False)
-        hourly_df.to_csv('hourly_utilization.csv', index=False)
-        revenue_df.to_csv('revenue_data.csv', index=False)
-        member_df.to_csv('member_data.csv', index=False)
+        # Save to CSV, overlapping the four independent writes
+        outputs = [
+            (occupancy_df, 'occupancy_data.csv'),
+            (hourly_df, 'hourly_utilization.csv'),
+            (revenue_df, 'revenue_data.csv'),
+            (member_df, 'member_data.csv')
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(write_csv, df, path)
+                       for df, path in outputs]
+            for future in futures:
+                future.result()
         
         print("✅ Generated Files:")
         print(f"   📊 occupancy_data.csv ({len(occupancy_df)} rows)")
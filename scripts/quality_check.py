@@ -11,19 +11,29 @@ import warnings
 warnings.filterwarnings('ignore')
 
 class DataQualityChecker:
-    def __init__(self):
+    # Column order for the tuples stored in self.issues
+    ISSUE_COLUMNS = ['timestamp', 'severity', 'category', 'message', 'details']
+
+    def __init__(self, time_each=False):
         self.issues = []
         self.passed_checks = []
-        
+        # Format the run timestamp once; add_issue reuses it unless
+        # per-issue timing was requested
+        self.time_each = time_each
+        self._run_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Unique key values per reference table, built once per
+        # (table, column) pair for referential integrity checks
+        self._key_cache = {}
+
     def add_issue(self, severity, category, message, details=None):
         """Log a data quality issue"""
-        self.issues.append({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'severity': severity,
-            'category': category,
-            'message': message,
-            'details': details
-        })
+        if self.time_each:
+            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        else:
+            timestamp = self._run_timestamp
+        # Tuples, not dicts: no per-issue key hashing, and the report
+        # converts to a DataFrame in one shot
+        self.issues.append((timestamp, severity, category, message, details))
     
     def add_pass(self, check_name):
         """Log a passed check"""
@@ -33,9 +43,11 @@ class DataQualityChecker:
         """Check for missing values in critical columns"""
         print(f"\n🔍 Checking missing values in {df_name}...")
         
-        missing = df.isnull().sum()
-        missing_pct = (missing / len(df)) * 100
-        
+        # len - count uses the C-level non-null counter and skips the
+        # boolean mask df.isnull() would materialize
+        missing = len(df) - df.count()
+        missing_pct = missing * (100.0 / len(df))
+
         critical_missing = missing[missing > 0]
         
         if len(critical_missing) > 0:
@@ -62,7 +74,14 @@ class DataQualityChecker:
         print(f"\n🔍 Checking duplicates in {df_name}...")
         
         if subset:
-            duplicates = df.duplicated(subset=subset).sum()
+            # Fold the subset columns into one integer key per row
+            # (factorize gives categorical codes) and count repeats,
+            # avoiding duplicated()'s object-dtype row hashing
+            codes = np.zeros(len(df), dtype=np.int64)
+            for col in subset:
+                col_codes, uniques = pd.factorize(df[col])
+                codes = codes * (len(uniques) + 1) + (col_codes + 1)
+            duplicates = len(df) - np.unique(codes).size
         else:
             duplicates = df.duplicated().sum()
         
@@ -79,27 +98,42 @@ class DataQualityChecker:
         """Check if numeric values are within expected ranges"""
         print(f"\n🔍 Checking data ranges in {df_name}...")
         
-        for col, (min_val, max_val) in range_checks.items():
-            if col in df.columns:
-                out_of_range = ((df[col] < min_val) | (df[col] > max_val)).sum()
-                
-                if out_of_range > 0:
-                    self.add_issue('MEDIUM', 'Range Validation',
-                                 f"{df_name}: {out_of_range} values in '{col}' outside range [{min_val}, {max_val}]",
-                                 {'column': col, 'count': int(out_of_range), 'expected_range': [min_val, max_val]})
-                    print(f"   ⚠️  Column '{col}': {out_of_range} values out of range")
-                else:
-                    self.add_pass(f"{df_name}.{col} range check")
-                    print(f"   ✅ Column '{col}': All values in valid range")
+        checks = [(col, bounds) for col, bounds in range_checks.items()
+                  if col in df.columns]
+        if not checks:
+            return
+
+        cols = [col for col, _ in checks]
+        mins = np.array([bounds[0] for _, bounds in checks])
+        maxs = np.array([bounds[1] for _, bounds in checks])
+
+        # One broadcast comparison covers every checked column
+        values = df[cols].to_numpy()
+        out_of_range_counts = ((values < mins) | (values > maxs)).sum(axis=0)
+
+        for (col, (min_val, max_val)), out_of_range in zip(checks, out_of_range_counts):
+            if out_of_range > 0:
+                self.add_issue('MEDIUM', 'Range Validation',
+                             f"{df_name}: {out_of_range} values in '{col}' outside range [{min_val}, {max_val}]",
+                             {'column': col, 'count': int(out_of_range), 'expected_range': [min_val, max_val]})
+                print(f"   ⚠️  Column '{col}': {out_of_range} values out of range")
+            else:
+                self.add_pass(f"{df_name}.{col} range check")
+                print(f"   ✅ Column '{col}': All values in valid range")
     
-    def check_data_freshness(self, df, df_name, date_column, max_age_days=7):
+    def check_data_freshness(self, df, df_name, date_column, max_age_days=7,
+                             date_format='%Y-%m-%d'):
         """Check if data is recent enough"""
         print(f"\n🔍 Checking data freshness in {df_name}...")
-        
+
         if date_column in df.columns:
             try:
-                df[date_column] = pd.to_datetime(df[date_column])
-                latest_date = df[date_column].max()
+                # Explicit format hits the C fast-path instead of per-value
+                # inference; parsing locally also leaves the caller's frame
+                # untouched
+                latest_date = pd.to_datetime(df[date_column],
+                                             format=date_format,
+                                             cache=True).max()
                 age_days = (datetime.now() - latest_date).days
                 
                 if age_days > max_age_days:
@@ -119,32 +153,43 @@ class DataQualityChecker:
         """Detect statistical outliers using IQR method"""
         print(f"\n🔍 Checking outliers in {df_name}...")
         
-        for col in numeric_columns:
-            if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                
-                outliers = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
-                outlier_pct = (outliers / len(df)) * 100
-                
-                if outlier_pct > 5:
-                    self.add_issue('LOW', 'Outliers',
-                                 f"{df_name}: Column '{col}' has {outliers} outliers ({outlier_pct:.1f}%)",
-                                 {'column': col, 'count': int(outliers), 'percentage': float(outlier_pct)})
-                    print(f"   ⚠️  Column '{col}': {outliers} outliers detected ({outlier_pct:.1f}%)")
-                else:
-                    self.add_pass(f"{df_name}.{col} outlier check")
+        cols = [col for col in numeric_columns
+                if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+        if not cols:
+            return
+
+        # Both quantiles for every column in one pass
+        values = df[cols].to_numpy()
+        q = np.nanquantile(values, [0.25, 0.75], axis=0)
+        Q1, Q3 = q[0], q[1]
+        IQR = Q3 - Q1
+
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+
+        outlier_counts = ((values < lower_bound) | (values > upper_bound)).sum(axis=0)
+        outlier_pcts = (outlier_counts / len(df)) * 100
+
+        for col, outliers, outlier_pct in zip(cols, outlier_counts, outlier_pcts):
+            if outlier_pct > 5:
+                self.add_issue('LOW', 'Outliers',
+                             f"{df_name}: Column '{col}' has {outliers} outliers ({outlier_pct:.1f}%)",
+                             {'column': col, 'count': int(outliers), 'percentage': float(outlier_pct)})
+                print(f"   ⚠️  Column '{col}': {outliers} outliers detected ({outlier_pct:.1f}%)")
+            else:
+                self.add_pass(f"{df_name}.{col} outlier check")
     
     def check_referential_integrity(self, df1, df2, df1_name, df2_name, key_column):
         """Check if foreign key relationships are valid"""
         print(f"\n🔍 Checking referential integrity between {df1_name} and {df2_name}...")
         
         if key_column in df1.columns and key_column in df2.columns:
-            orphaned = ~df1[key_column].isin(df2[key_column])
+            cache_key = (id(df2), key_column)
+            if cache_key not in self._key_cache:
+                self._key_cache[cache_key] = np.unique(df2[key_column].values)
+            valid_keys = self._key_cache[cache_key]
+
+            orphaned = ~np.isin(df1[key_column].values, valid_keys)
             orphaned_count = orphaned.sum()
             
             if orphaned_count > 0:
@@ -156,6 +201,91 @@ class DataQualityChecker:
                 self.add_pass(f"Referential integrity: {df1_name} ↔ {df2_name}")
                 print(f"   ✅ Referential integrity maintained")
     
+    def check_all(self, df, df_name, spec):
+        """Run every configured check for one dataset over shared passes.
+
+        spec keys (all optional): 'dup_subset', 'range_checks',
+        'outlier_cols', 'date_col', 'max_age_days'. Range and outlier
+        checks read from a single extracted numeric block instead of
+        re-slicing the DataFrame per check.
+        """
+        range_checks = spec.get('range_checks') or {}
+        outlier_cols = spec.get('outlier_cols') or []
+
+        # Extract the numeric block once; every numeric check below
+        # reads from this array
+        numeric_cols = [col for col in
+                        dict.fromkeys(list(range_checks) + list(outlier_cols))
+                        if col in df.columns
+                        and pd.api.types.is_numeric_dtype(df[col])]
+        values = df[numeric_cols].to_numpy(dtype=np.float64) \
+            if numeric_cols else None
+
+        # Missing values: NaN counts for the numeric block come from the
+        # shared array, remaining columns from the C-level counter
+        print(f"\n🔍 Checking missing values in {df_name}...")
+        missing = len(df) - df.count()
+        if numeric_cols:
+            missing[numeric_cols] = np.isnan(values).sum(axis=0)
+        missing_pct = missing * (100.0 / len(df))
+        critical_missing = missing[missing > 0]
+        if len(critical_missing) > 0:
+            for col, count in critical_missing.items():
+                pct = missing_pct[col]
+                severity = 'HIGH' if pct > 10 else 'MEDIUM' if pct > 5 else 'LOW'
+                self.add_issue(severity, 'Missing Data',
+                             f"{df_name}: Column '{col}' has {count} missing values ({pct:.1f}%)",
+                             {'column': col, 'count': int(count), 'percentage': float(pct)})
+        else:
+            self.add_pass(f"No missing values in {df_name}")
+            print(f"   ✅ No missing values detected")
+
+        self.check_duplicates(df, df_name, subset=spec.get('dup_subset'))
+
+        # Range checks against the shared numeric block
+        if range_checks:
+            print(f"\n🔍 Checking data ranges in {df_name}...")
+            checked = [col for col in range_checks if col in numeric_cols]
+            idx = [numeric_cols.index(col) for col in checked]
+            mins = np.array([range_checks[col][0] for col in checked])
+            maxs = np.array([range_checks[col][1] for col in checked])
+            sub = values[:, idx]
+            out_of_range_counts = ((sub < mins) | (sub > maxs)).sum(axis=0)
+            for col, out_of_range in zip(checked, out_of_range_counts):
+                min_val, max_val = range_checks[col]
+                if out_of_range > 0:
+                    self.add_issue('MEDIUM', 'Range Validation',
+                                 f"{df_name}: {out_of_range} values in '{col}' outside range [{min_val}, {max_val}]",
+                                 {'column': col, 'count': int(out_of_range), 'expected_range': [min_val, max_val]})
+                    print(f"   ⚠️  Column '{col}': {out_of_range} values out of range")
+                else:
+                    self.add_pass(f"{df_name}.{col} range check")
+                    print(f"   ✅ Column '{col}': All values in valid range")
+
+        if spec.get('date_col'):
+            self.check_data_freshness(df, df_name, spec['date_col'],
+                                      max_age_days=spec.get('max_age_days', 7))
+
+        # Outliers from the same numeric block
+        checked = [col for col in outlier_cols if col in numeric_cols]
+        if checked:
+            print(f"\n🔍 Checking outliers in {df_name}...")
+            sub = values[:, [numeric_cols.index(col) for col in checked]]
+            q = np.nanquantile(sub, [0.25, 0.75], axis=0)
+            IQR = q[1] - q[0]
+            lower_bound = q[0] - 1.5 * IQR
+            upper_bound = q[1] + 1.5 * IQR
+            outlier_counts = ((sub < lower_bound) | (sub > upper_bound)).sum(axis=0)
+            outlier_pcts = (outlier_counts / len(df)) * 100
+            for col, outliers, outlier_pct in zip(checked, outlier_counts, outlier_pcts):
+                if outlier_pct > 5:
+                    self.add_issue('LOW', 'Outliers',
+                                 f"{df_name}: Column '{col}' has {outliers} outliers ({outlier_pct:.1f}%)",
+                                 {'column': col, 'count': int(outliers), 'percentage': float(outlier_pct)})
+                    print(f"   ⚠️  Column '{col}': {outliers} outliers detected ({outlier_pct:.1f}%)")
+                else:
+                    self.add_pass(f"{df_name}.{col} outlier check")
+
     def generate_report(self):
         """Generate comprehensive quality report"""
         print("\n" + "="*70)
@@ -166,18 +296,19 @@ class DataQualityChecker:
         print(f"⚠️  Issues Found: {len(self.issues)}")
         
         if len(self.issues) > 0:
-            severity_counts = pd.DataFrame(self.issues)['severity'].value_counts()
+            issues_df = pd.DataFrame(self.issues, columns=self.ISSUE_COLUMNS)
+            severity_counts = issues_df['severity'].value_counts()
             print(f"\n📊 Issues by Severity:")
             for severity, count in severity_counts.items():
                 emoji = '🔴' if severity == 'HIGH' else '🟡' if severity == 'MEDIUM' else '🟢'
                 print(f"   {emoji} {severity}: {count}")
             
             print(f"\n📝 Detailed Issues:")
-            for i, issue in enumerate(self.issues, 1):
-                emoji = '🔴' if issue['severity'] == 'HIGH' else '🟡' if issue['severity'] == 'MEDIUM' else '🟢'
-                print(f"\n   {i}. {emoji} [{issue['severity']}] {issue['category']}")
-                print(f"      {issue['message']}")
-                print(f"      Time: {issue['timestamp']}")
+            for i, (timestamp, severity, category, message, _) in enumerate(self.issues, 1):
+                emoji = '🔴' if severity == 'HIGH' else '🟡' if severity == 'MEDIUM' else '🟢'
+                print(f"\n   {i}. {emoji} [{severity}] {category}")
+                print(f"      {message}")
+                print(f"      Time: {timestamp}")
         else:
             print("\n🎉 All quality checks passed! Data is clean and ready for analysis.")
         
@@ -198,41 +329,55 @@ def run_quality_checks():
     print("="*70)
     
     try:
-        # Load datasets
+        # Load only the columns the checks below use, with explicit
+        # dtypes so the parser skips inference and keeps frames narrow
         print("\n📂 Loading datasets...")
-        occupancy_df = pd.read_csv('occupancy_data.csv')
-        revenue_df = pd.read_csv('revenue_data.csv')
-        member_df = pd.read_csv('member_data.csv')
+        occupancy_df = pd.read_csv(
+            'occupancy_data.csv',
+            usecols=['date', 'location', 'occupancy_rate', 'capacity'],
+            dtype={'location': 'category', 'occupancy_rate': 'float32',
+                   'capacity': 'int16'})
+        revenue_df = pd.read_csv(
+            'revenue_data.csv',
+            dtype={'month': 'int8', 'location': 'category',
+                   'space_type': 'category', 'units_sold': 'int32',
+                   'revenue': 'int64', 'avg_price': 'int32'})
+        member_df = pd.read_csv(
+            'member_data.csv',
+            usecols=['member_id', 'join_date'])
         print("   ✅ All datasets loaded successfully")
         
-        # Run checks on occupancy data
-        checker.check_missing_values(occupancy_df, 'occupancy_data')
-        checker.check_duplicates(occupancy_df, 'occupancy_data', subset=['date', 'location'])
-        checker.check_data_ranges(occupancy_df, 'occupancy_data', {
-            'occupancy_rate': (0, 100),
-            'capacity': (50, 200)
+        # One fused pass per dataset
+        checker.check_all(occupancy_df, 'occupancy_data', {
+            'dup_subset': ['date', 'location'],
+            'range_checks': {
+                'occupancy_rate': (0, 100),
+                'capacity': (50, 200)
+            },
+            'date_col': 'date',
+            'max_age_days': 7,
+            'outlier_cols': ['occupancy_rate']
         })
-        checker.check_data_freshness(occupancy_df, 'occupancy_data', 'date', max_age_days=7)
-        checker.check_outliers(occupancy_df, 'occupancy_data', ['occupancy_rate'])
-        
-        # Run checks on revenue data
-        checker.check_missing_values(revenue_df, 'revenue_data')
-        checker.check_duplicates(revenue_df, 'revenue_data')
-        checker.check_data_ranges(revenue_df, 'revenue_data', {
-            'revenue': (0, 10000000),
-            'units_sold': (0, 500)
+
+        checker.check_all(revenue_df, 'revenue_data', {
+            'range_checks': {
+                'revenue': (0, 10000000),
+                'units_sold': (0, 500)
+            }
+        })
+
+        checker.check_all(member_df, 'member_data', {
+            'dup_subset': ['member_id'],
+            'date_col': 'join_date',
+            'max_age_days': 365
         })
-        
-        # Run checks on member data
-        checker.check_missing_values(member_df, 'member_data')
-        checker.check_duplicates(member_df, 'member_data', subset=['member_id'])
-        checker.check_data_freshness(member_df, 'member_data', 'join_date', max_age_days=365)
         
         # Generate final report
         report = checker.generate_report()
         
         # Save report to file
-        report_df = pd.DataFrame(checker.issues)
+        report_df = pd.DataFrame(checker.issues,
+                                 columns=DataQualityChecker.ISSUE_COLUMNS)
         if len(report_df) > 0:
             report_df.to_csv('data_quality_report.csv', index=False)
             print("\n💾 Quality report saved to: data_quality_report.csv")